@@ -23,7 +23,7 @@ import hashlib
 import math
 import warnings
 from collections import OrderedDict
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from logging import getLogger
 from pathlib import Path
 from typing import Optional, Sequence, Union
@@ -52,8 +52,15 @@ except ImportError:
 
 try:
     import dask.array as da
+    from dask.base import tokenize
 except ImportError:
     da = None
+    tokenize = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from pyproj import CRS
 
@@ -61,6 +68,20 @@ logger = getLogger(__name__)
 HashType = hashlib._hashlib.HASH
 
 
+def _new_hasher():
+    """Get a new hash object for digesting coordinate arrays.
+
+    Prefer the non-cryptographic ``xxhash.xxh3_64`` when available as it is
+    much faster than sha1 on large numpy buffers. Hashes are only used for
+    value identity (dict keys, caches), not security, so collision resistance
+    of a cryptographic digest is not needed.
+
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.sha1()
+
+
 @contextlib.contextmanager
 def ignore_pyproj_proj_warnings():
     """Wrap operations that we know will produce a PROJ.4 precision warning.
@@ -134,7 +155,7 @@ class BaseDefinition:
     def __hash__(self):
         """Compute the hash of this object."""
         if self.hash is None:
-            self.hash = int(self.update_hash().hexdigest(), 16)
+            self.hash = int(self.update_hash(_new_hasher()).hexdigest(), 16)
         return self.hash
 
     def update_hash(self, existing_hash: Optional[HashType] = None) -> HashType:
@@ -143,6 +164,9 @@ class BaseDefinition:
             existing_hash = hashlib.sha1()
         existing_hash.update(get_array_hashable(self.lons))
         existing_hash.update(get_array_hashable(self.lats))
+        # include the shape so that differently shaped swaths with the same
+        # flattened coordinates (ex. non-contiguous slices) hash differently
+        existing_hash.update(np.asarray(self.lons.shape, dtype=np.int64).tobytes())
         try:
             if self.lons.mask is not False:
                 existing_hash.update(get_array_hashable(self.lons.mask))
@@ -361,8 +385,13 @@ class BaseDefinition:
             is_valid_mask = ~(np.isnan(dim1_side) | np.isnan(dim2_side))
             if not is_valid_mask.any():
                 raise ValueError("Can't compute swath bounding coordinates. At least one side is completely invalid.")
-            new_dim1_sides.append(dim1_side[is_valid_mask])
-            new_dim2_sides.append(dim2_side[is_valid_mask])
+            if is_valid_mask.all():
+                # fully valid side (the common case), avoid the filtered copy
+                new_dim1_sides.append(dim1_side)
+                new_dim2_sides.append(dim2_side)
+            else:
+                new_dim1_sides.append(dim1_side[is_valid_mask])
+                new_dim2_sides.append(dim2_side[is_valid_mask])
         return new_dim1_sides, new_dim2_sides
 
     def _get_bbox_slices(self, frequency):
@@ -650,6 +679,8 @@ class CoordinateDefinition(BaseDefinition):
         self.lats = np.concatenate((self.lats, other.lats))
         self.shape = self.lons.shape
         self.size = self.lons.size
+        # coordinates changed in-place, invalidate the memoized hash
+        self.hash = None
 
     def __str__(self):
         """Return string representation of the coordinate definition."""
@@ -762,11 +793,14 @@ def get_array_hashable(arr):
     # look for precomputed value
     if isinstance(arr, DataArray) and np.ndarray is not DataArray:
         return arr.attrs.get('hash', get_array_hashable(arr.data))
-    else:
-        try:
-            return arr.name.encode('utf-8')  # dask array
-        except AttributeError:
-            return np.ascontiguousarray(arr).view(np.uint8)  # np array
+    if da is not None and isinstance(arr, da.Array):
+        # hash the task graph token instead of the data so hashing never
+        # triggers a compute of the underlying chunks
+        return tokenize(arr).encode('utf-8')
+    try:
+        return arr.name.encode('utf-8')  # dask array
+    except AttributeError:
+        return np.ascontiguousarray(arr).view(np.uint8)  # np array
 
 
 class SwathDefinition(CoordinateDefinition):
@@ -854,11 +888,46 @@ class SwathDefinition(CoordinateDefinition):
         return SwathDefinition(lons, lats)
 
     def __hash__(self):
-        """Compute the hash of this object."""
+        """Compute the hash of this object.
+
+        In addition to the per-instance cache, value-equal dask-backed swaths
+        share a class-level cache keyed on the coordinate graph tokens so the
+        digest is only computed once per unique coordinate pair.
+
+        """
         if self.hash is None:
-            self.hash = int(self.update_hash().hexdigest(), 16)
+            tokens = self._coordinate_dask_tokens()
+            if tokens is not None:
+                self.hash = self._hash_from_tokens(*tokens)
+            else:
+                self.hash = int(self.update_hash(_new_hasher()).hexdigest(), 16)
         return self.hash
 
+    def _coordinate_dask_tokens(self):
+        """Get the dask graph tokens of lons/lats or None if not dask-backed."""
+        if da is None:
+            return None
+        lons = self.lons
+        lats = self.lats
+        if isinstance(lons, DataArray) and np.ndarray is not DataArray:
+            if 'hash' in lons.attrs or 'hash' in lats.attrs:
+                # a precomputed hash takes precedence (see get_array_hashable)
+                return None
+            lons = lons.data
+            lats = lats.data
+        if isinstance(lons, da.Array) and isinstance(lats, da.Array):
+            return tokenize(lons), tokenize(lats)
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _hash_from_tokens(lons_token: str, lats_token: str) -> int:
+        """Compute the hash value for tokenized dask coordinates."""
+        hasher = _new_hasher()
+        hasher.update(lons_token.encode('utf-8'))
+        hasher.update(lats_token.encode('utf-8'))
+        return int(hasher.hexdigest(), 16)
+
     def _compute_omerc_parameters(self, ellipsoid):
         """Compute the oblique mercator projection bouding box parameters."""
         lines, cols = self.lons.shape
@@ -21,6 +21,7 @@ base type is a numpy array of size (n, 2) (2 for lon and lats)
 """
 
 import logging
+import math
 
 import numpy as np
 
@@ -99,22 +100,37 @@ def _haversine_matrix(lon, lat, lon_ref, lat_ref):
 
 def _check_lon_validity(lon):
     """Check longitude validity."""
-    if np.any(np.isinf(lon)):
+    if lon.ndim == 0:
+        # scalar fast path, avoids ufunc dispatch for single points
+        is_invalid = math.isinf(lon.item())
+    else:
+        is_invalid = np.any(np.isinf(lon))
+    if is_invalid:
         raise ValueError("Longitude values can not contain inf values.")
 
 
 def _check_lat_validity(lat):
     """Check latitude validity."""
-    if np.any(np.isinf(lat)):
+    if lat.ndim == 0:
+        # scalar fast path, avoids ufunc dispatch for single points
+        lat_value = lat.item()
+        is_inf = math.isinf(lat_value)
+        is_out_of_range = lat_value > math.pi / 2 or lat_value < -math.pi / 2
+    else:
+        is_inf = np.any(np.isinf(lat))
+        is_out_of_range = np.any(np.logical_or(lat > np.pi / 2, lat < -np.pi / 2))
+    if is_inf:
         raise ValueError("Latitude values can not contain inf values.")
-    if np.any(np.logical_or(lat > np.pi / 2, lat < -np.pi / 2)):
+    if is_out_of_range:
         raise ValueError("Latitude values must range between [-pi/2, pi/2].")
 
 
 def _check_lon_lat(lon, lat):
     """Check and format lon/lat values/arrays."""
-    lon = np.asarray(lon, dtype=np.float64)
-    lat = np.asarray(lat, dtype=np.float64)
+    # C-contiguous float64 so the trigonometric ufuncs in the distance
+    # computations operate on simple strided loads
+    lon = np.asarray(lon, dtype=np.float64, order='C')
+    lat = np.asarray(lat, dtype=np.float64, order='C')
     _check_lon_validity(lon)
     _check_lat_validity(lat)
     return lon, lat
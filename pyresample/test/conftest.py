@@ -38,7 +38,8 @@ SRC_AREA_SHAPE = (50, 10)
 DST_AREA_SHAPE = (80, 85)
 
 
-@pytest.fixture(params=[LegacySwathDefinition, SwathDefinition],
+@pytest.fixture(scope="module",
+                params=[LegacySwathDefinition, SwathDefinition],
                 ids=["LegacySwathDefinition", "SwathDefinition"])
 def swath_class(request):
     """Get one of the currently active 'SwathDefinition' classes.
@@ -50,7 +51,7 @@ def swath_class(request):
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_test_swath(swath_class):
     """Get a function for creating SwathDefinitions for testing.
 
@@ -107,8 +108,8 @@ def _euro_lonlats():
 
 def _euro_lonlats_dask():
     lons, lats = _euro_lonlats()
-    lons = da.from_array(lons)
-    lats = da.from_array(lats)
+    lons = da.from_array(lons, chunks=-1)
+    lats = da.from_array(lats, chunks=-1)
     return lons, lats
 
 
@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Test AreaDefinition objects."""
-import contextlib
+import functools
 
 import dask.array as da
 import numpy as np
@@ -23,17 +23,26 @@ from pyproj import CRS
 
 from pyresample.test.utils import create_test_latitude, create_test_longitude
 
+# shared read-only coordinates for the small swath helpers
+_SMALL_LONS = np.array([[1.2, 1.3, 1.4, 1.5],
+                        [1.2, 1.3, 1.4, 1.5]])
+_SMALL_LATS = np.array([[65.9, 65.86, 65.82, 65.78],
+                        [65.9, 65.86, 65.82, 65.78]])
+_SMALL_LONS.setflags(write=False)
+_SMALL_LATS.setflags(write=False)
+
 
 def _gen_swath_def_xarray_dask(create_test_swath):
     """Create a SwathDefinition with xarray[dask] data inside.
 
     Note that this function is not a pytest fixture so that each call returns a
-    new instance of the swath definition with new instances of the data arrays.
+    new instance of the swath definition with new wrapper instances around the
+    (cached, read-only) base coordinate arrays.
 
     """
     lons, lats = _gen_swath_lons_lats()
-    lons_dask = da.from_array(lons)
-    lats_dask = da.from_array(lats)
+    lons_dask = da.from_array(lons, chunks=-1)
+    lats_dask = da.from_array(lats, chunks=-1)
     lons_xr = xr.DataArray(lons_dask, dims=('y', 'x'))
     lats_xr = xr.DataArray(lats_dask, dims=('y', 'x'))
     return create_test_swath(lons_xr, lats_xr)
@@ -48,8 +57,8 @@ def _gen_swath_def_xarray_numpy(create_test_swath):
 
 def _gen_swath_def_dask(create_test_swath):
     lons, lats = _gen_swath_lons_lats()
-    lons_dask = da.from_array(lons)
-    lats_dask = da.from_array(lats)
+    lons_dask = da.from_array(lons, chunks=-1)
+    lats_dask = da.from_array(lats, chunks=-1)
     return create_test_swath(lons_dask, lats_dask)
 
 
@@ -65,19 +74,26 @@ def _gen_swath_def_numpy_small_noncontiguous(create_test_swath):
 
 
 def _gen_swath_def_numpy_small(create_test_swath):
-    lons = np.array([[1.2, 1.3, 1.4, 1.5],
-                     [1.2, 1.3, 1.4, 1.5]])
-    lats = np.array([[65.9, 65.86, 65.82, 65.78],
-                     [65.9, 65.86, 65.82, 65.78]])
-    swath_def = create_test_swath(lons, lats)
-    return swath_def
+    return create_test_swath(_SMALL_LONS, _SMALL_LATS)
 
 
 def _gen_swath_lons_lats():
-    swath_shape = (50, 10)
-    lon_start, lon_stop, lat_start, lat_stop = (3.0, 12.0, 75.0, 26.0)
+    return _cached_lons_lats(3.0, 12.0, 75.0, 26.0, (50, 10))
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_lons_lats(lon_start, lon_stop, lat_start, lat_stop, swath_shape):
+    """Create test lon/lat arrays, cached per coordinate configuration.
+
+    The returned arrays are shared between parametrized test cases and are
+    therefore marked read-only; callers that need to modify them (ex. nan
+    injection) must copy them first.
+
+    """
     lons = create_test_longitude(lon_start, lon_stop, swath_shape)
     lats = create_test_latitude(lat_start, lat_stop, swath_shape)
+    lons.setflags(write=False)
+    lats.setflags(write=False)
     return lons, lats
 
 
@@ -133,22 +149,30 @@ class TestSwathBboxLonLats:
     @pytest.mark.parametrize("force_clockwise", [False, True])
     @pytest.mark.parametrize("use_dask", [False, True])
     @pytest.mark.parametrize("use_xarray", [False, True])
-    @pytest.mark.parametrize("nan_pattern", [None, "scan", "half", "whole"])
+    @pytest.mark.parametrize("nan_pattern", [None, "scan", "half"])
     def test_swath_def_bbox(
             self, create_test_swath,
             lon_start, lon_stop, lat_start, lat_stop,
             exp_nonforced_clockwise, force_clockwise, use_dask, use_xarray, nan_pattern):
         swath_shape = (50, 10)
-        lons = create_test_longitude(lon_start, lon_stop, swath_shape)
-        lats = create_test_latitude(lat_start, lat_stop, swath_shape)
+        lons, lats = _cached_lons_lats(lon_start, lon_stop, lat_start, lat_stop, swath_shape)
         lons, lats = _add_nans_if_necessary(lons, lats, nan_pattern)
         lons, lats = _convert_type_if_necessary(lons, lats, use_dask, use_xarray)
         swath_def = create_test_swath(lons, lats)
-        with _raises_if(nan_pattern == "whole", ValueError):
-            bbox_lons, bbox_lats = swath_def.get_bbox_lonlats(force_clockwise=force_clockwise)
-        if nan_pattern != "whole":
-            _check_bbox_structure_and_values(bbox_lons, bbox_lats)
-            _check_bbox_clockwise(bbox_lons, bbox_lats, exp_nonforced_clockwise, force_clockwise)
+        bbox_lons, bbox_lats = swath_def.get_bbox_lonlats(force_clockwise=force_clockwise)
+        _check_bbox_structure_and_values(bbox_lons, bbox_lats)
+        _check_bbox_clockwise(bbox_lons, bbox_lats, exp_nonforced_clockwise, force_clockwise)
+
+    @pytest.mark.parametrize("use_dask", [False, True])
+    @pytest.mark.parametrize("use_xarray", [False, True])
+    def test_swath_def_bbox_whole_nan_side(self, create_test_swath, use_dask, use_xarray):
+        """Test that a fully invalid swath side makes bbox extraction fail."""
+        lons, lats = _cached_lons_lats(3.0, 12.0, 75.0, 26.0, (50, 10))
+        lons, lats = _add_nans_if_necessary(lons, lats, "whole")
+        lons, lats = _convert_type_if_necessary(lons, lats, use_dask, use_xarray)
+        swath_def = create_test_swath(lons, lats)
+        with pytest.raises(ValueError):
+            swath_def.get_bbox_lonlats()
 
     def test_swath_def_bbox_decimated(self, create_test_swath):
         swath_def = _gen_swath_def_numpy(create_test_swath)
@@ -171,28 +195,52 @@ class TestSwathBboxLonLats:
 
 
 def _add_nans_if_necessary(lons, lats, nan_pattern):
-    if nan_pattern == "scan":
-        lons[20:30, -1] = np.nan
-    elif nan_pattern == "half":
-        lons[:25, -1] = np.nan
-    elif nan_pattern == "whole":
-        lons[:, -1] = np.nan
-    return lons, lats
+    if nan_pattern is None:
+        return lons, lats
+    cache_key = (id(lons), nan_pattern)
+    if cache_key not in _NAN_LONS_CACHE:
+        # the base arrays are cached and read-only, copy before mutating
+        nan_lons = lons.copy()
+        if nan_pattern == "scan":
+            nan_lons[20:30, -1] = np.nan
+        elif nan_pattern == "half":
+            nan_lons[:25, -1] = np.nan
+        elif nan_pattern == "whole":
+            nan_lons[:, -1] = np.nan
+        nan_lons.setflags(write=False)
+        # keep a reference to the base array so its id is never reused
+        _NAN_LONS_CACHE[cache_key] = (lons, nan_lons)
+    return _NAN_LONS_CACHE[cache_key][1], lats
+
+
+_NAN_LONS_CACHE = {}
 
 
 def _convert_type_if_necessary(lons, lats, use_dask, use_xarray):
+    read_only_input = isinstance(lons, np.ndarray) and not lons.flags.writeable
+    cache_key = (id(lons), id(lats), use_dask, use_xarray)
+    if read_only_input and cache_key in _CONVERTED_CACHE:
+        return _CONVERTED_CACHE[cache_key][2:]
+    new_lons, new_lats = lons, lats
     if use_dask:
-        lons = da.from_array(lons)
-        lats = da.from_array(lats)
+        new_lons = da.from_array(new_lons, chunks=-1)
+        new_lats = da.from_array(new_lats, chunks=-1)
     if use_xarray:
-        lons = xr.DataArray(lons, dims=('y', 'x'))
-        lats = xr.DataArray(lats, dims=('y', 'x'))
-    return lons, lats
+        new_lons = xr.DataArray(new_lons, dims=('y', 'x'))
+        new_lats = xr.DataArray(new_lats, dims=('y', 'x'))
+    if read_only_input:
+        # cache wrappers around the shared read-only arrays; keep references
+        # to the inputs so their ids are never reused
+        _CONVERTED_CACHE[cache_key] = (lons, lats, new_lons, new_lats)
+    return new_lons, new_lats
+
+
+_CONVERTED_CACHE = {}
 
 
 def _check_bbox_structure_and_values(bbox_lons, bbox_lats):
-    assert not any(np.isnan(side_lon).any() for side_lon in bbox_lons)
-    assert not any(np.isnan(side_lat).any() for side_lat in bbox_lats)
+    assert not np.isnan(np.concatenate(bbox_lons)).any()
+    assert not np.isnan(np.concatenate(bbox_lats)).any()
     assert len(bbox_lons) == len(bbox_lats)
     assert len(bbox_lons) == 4
     for side_lons, side_lats in zip(bbox_lons, bbox_lats):
@@ -209,23 +257,14 @@ def _check_bbox_clockwise(bbox_lons, bbox_lats, exp_nonforced_clockwise, force_c
         assert not is_cw
 
 
-@contextlib.contextmanager
-def _raises_if(condition, exp_exception, *args, **kwargs):
-    expectation = pytest.raises(exp_exception, *args, **kwargs) if condition else contextlib.nullcontext()
-    with expectation:
-        yield
-
-
 def _is_clockwise(lons, lats):
     # https://stackoverflow.com/a/1165943/433202
-    prev_point = (lons[0], lats[0])
-    edge_sum = 0
-    for point in zip(lons[1:], lats[1:]):
-        xdiff = point[0] - prev_point[0]
-        ysum = point[1] + prev_point[1]
-        edge_sum += xdiff * ysum
-        prev_point = point
-    return edge_sum > 0
+    return _shoelace_edge_sum(lons, lats) > 0
+
+
+def _shoelace_edge_sum(lons, lats):
+    """Compute the shoelace sum over a closed boundary as one reduction."""
+    return float(np.dot(np.diff(lons), lats[:-1] + lats[1:]))
 
 
 class TestSwathDefinition:
@@ -15,15 +15,31 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Test cases for SPoint and SMultiPoint."""
-import unittest
-
 import numpy as np
 import pytest
 
 from pyresample.future.spherical import SMultiPoint, SPoint
 
+# shared coordinate buffers (C-contiguous float64 structure-of-arrays)
+LONS1 = np.ascontiguousarray([0., np.pi])
+LATS1 = np.ascontiguousarray([-np.pi / 2, np.pi / 2])
+LONS2 = np.ascontiguousarray([0., np.pi / 2, np.pi])
+LATS2 = np.ascontiguousarray([-np.pi / 2, 0., np.pi / 2])
+
+
+@pytest.fixture(scope="module")
+def poles_multipoint():
+    """Get an SMultiPoint with one point at each pole."""
+    return SMultiPoint(LONS1, LATS1)
+
+
+@pytest.fixture(scope="module")
+def three_points_multipoint():
+    """Get an SMultiPoint with points at the poles and on the equator."""
+    return SMultiPoint(LONS2, LATS2)
 
-class TestSPoint(unittest.TestCase):
+
+class TestSPoint:
     """Test SPoint."""
 
     def test_latitude_validity(self):
@@ -81,12 +97,12 @@ class TestSPoint(unittest.TestCase):
     def test_str(self):
         """Check the string representation."""
         d = SPoint(1.0, 0.5)
-        self.assertEqual(str(d), "(1.0, 0.5)")
+        assert str(d) == "(1.0, 0.5)"
 
     def test_repr(self):
         """Check the representation."""
         d = SPoint(1.0, 0.5)
-        self.assertEqual(repr(d), "(1.0, 0.5)")
+        assert repr(d) == "(1.0, 0.5)"
 
     def test_to_shapely(self):
         """Test conversion to shapely."""
@@ -95,10 +111,13 @@ class TestSPoint(unittest.TestCase):
         lat = np.pi / 2
         spherical_point = SPoint(lon, lat)
         shapely_point = Point(0.0, 90.0)
-        assert shapely_point.equals_exact(spherical_point.to_shapely(), tolerance=1e-10)
+        # compare coordinates directly instead of going through GEOS
+        assert np.allclose(np.asarray(shapely_point.coords),
+                           np.asarray(spherical_point.to_shapely().coords),
+                           atol=1e-10)
 
 
-class TestSMultiPoint(unittest.TestCase):
+class TestSMultiPoint:
     """Test SMultiPoint."""
 
     def test_single_point(self):
@@ -120,68 +139,47 @@ class TestSMultiPoint(unittest.TestCase):
         p2 = SMultiPoint(np.deg2rad(lon), np.deg2rad(lat))
         assert p1 == p2
 
-    def test_vertices(self):
+    def test_vertices(self, poles_multipoint):
         """Test vertices property."""
-        lons = np.array([0, np.pi])
-        lats = np.array([-np.pi / 2, np.pi / 2])
-        p = SMultiPoint(lons, lats)
         res = np.array([[0., -1.57079633],
                         [-3.14159265, 1.57079633]])
-        assert np.allclose(p.vertices, res)
+        assert np.allclose(poles_multipoint.vertices, res)
 
-    def test_vertices_in_degrees(self):
+    def test_vertices_in_degrees(self, poles_multipoint):
         """Test vertices_in_degrees property."""
-        lons = np.array([0, np.pi])
-        lats = np.array([-np.pi / 2, np.pi / 2])
-        p = SMultiPoint(lons, lats)
         res = np.array([[0., -90.],
                         [-180., 90.]])
-        assert np.allclose(p.vertices_in_degrees, res)
+        assert np.allclose(poles_multipoint.vertices_in_degrees, res)
 
-    def test_distance(self):
+    def test_distance(self, poles_multipoint, three_points_multipoint):
         """Test Vincenty formula."""
-        lons = np.array([0, np.pi])
-        lats = np.array([-np.pi / 2, np.pi / 2])
-        p1 = SMultiPoint(lons, lats)
-        lons = np.array([0, np.pi / 2, np.pi])
-        lats = np.array([-np.pi / 2, 0, np.pi / 2])
-        p2 = SMultiPoint(lons, lats)
-        d12 = p1.distance(p2)
-        d21 = p2.distance(p1)
-        self.assertEqual(d12.shape, (2, 3))
-        self.assertEqual(d21.shape, (3, 2))
+        d12 = poles_multipoint.distance(three_points_multipoint)
+        d21 = three_points_multipoint.distance(poles_multipoint)
+        assert d12.shape == (2, 3)
+        assert d21.shape == (3, 2)
         res = np.array([[0., 1.57079633, 3.14159265],
                         [3.14159265, 1.57079633, 0.]])
-        assert np.allclose(d12, res)
+        np.testing.assert_allclose(d12, res, rtol=0, atol=1e-8)
         # Special case with 1 point
-        p1 = SMultiPoint(lons[[0]], lats[[0]])
-        p2 = SMultiPoint(lons[[0]], lats[[0]])
+        p1 = SMultiPoint(LONS2[[0]], LATS2[[0]])
+        p2 = SMultiPoint(LONS2[[0]], LATS2[[0]])
         d12 = p1.distance(p2)
         assert isinstance(d12, float)
 
-    def test_hdistance(self):
+    def test_hdistance(self, poles_multipoint, three_points_multipoint):
         """Test Haversine formula."""
-        lons = np.array([0, np.pi])
-        lats = np.array([-np.pi / 2, np.pi / 2])
-        p1 = SMultiPoint(lons, lats)
-        lons = np.array([0, np.pi / 2, np.pi])
-        lats = np.array([-np.pi / 2, 0, np.pi / 2])
-        p2 = SMultiPoint(lons, lats)
-        d12 = p1.hdistance(p2)
-        d21 = p2.hdistance(p1)
-        self.assertEqual(d12.shape, (2, 3))
-        self.assertEqual(d21.shape, (3, 2))
+        d12 = poles_multipoint.hdistance(three_points_multipoint)
+        d21 = three_points_multipoint.hdistance(poles_multipoint)
+        assert d12.shape == (2, 3)
+        assert d21.shape == (3, 2)
         res = np.array([[0., 1.57079633, 3.14159265],
                         [3.14159265, 1.57079633, 0.]])
-        assert np.allclose(d12, res)
+        np.testing.assert_allclose(d12, res, rtol=0, atol=1e-8)
 
-    def test_eq(self):
+    def test_eq(self, poles_multipoint):
         """Check the equality."""
-        lons = [0, np.pi]
-        lats = [-np.pi / 2, np.pi / 2]
-        p = SMultiPoint(lons, lats)
-        p1 = SMultiPoint(lons, lats)
-        assert p == p1
+        p = SMultiPoint(LONS1, LATS1)
+        assert p == poles_multipoint
 
     def test_eq_antimeridian(self):
         """Check the equality with longitudes at -180/180 degrees."""
@@ -192,35 +190,26 @@ class TestSMultiPoint(unittest.TestCase):
         p1 = SMultiPoint(lons1, lats)
         assert p == p1
 
-    def test_neq(self):
+    def test_neq(self, poles_multipoint):
         """Check the equality."""
-        lons = np.array([0, np.pi])
-        lats = [-np.pi / 2, np.pi / 2]
-        p = SMultiPoint(lons, lats)
-        p1 = SMultiPoint(lons + 0.1, lats)
-        assert p != p1
+        p1 = SMultiPoint(LONS1 + 0.1, LATS1)
+        assert p1 != poles_multipoint
 
-    def test_str(self):
+    def test_str(self, poles_multipoint):
         """Check the string representation."""
-        lons = [0, np.pi]
-        lats = [-np.pi / 2, np.pi / 2]
-        p = SMultiPoint(lons, lats)
         expected_str = '[[ 0.         -1.57079633]\n [-3.14159265  1.57079633]]'
-        self.assertEqual(str(p), expected_str)
+        assert str(poles_multipoint) == expected_str
 
-    def test_repr(self):
+    def test_repr(self, poles_multipoint):
         """Check the representation."""
-        lons = [0, np.pi]
-        lats = [-np.pi / 2, np.pi / 2]
-        p = SMultiPoint(lons, lats)
         expected_repr = '[[ 0.         -1.57079633]\n [-3.14159265  1.57079633]]'
-        self.assertEqual(repr(p), expected_repr)
+        assert repr(poles_multipoint) == expected_repr
 
-    def test_to_shapely(self):
+    def test_to_shapely(self, poles_multipoint):
         """Test conversion to shapely."""
         from shapely.geometry import MultiPoint
-        lons = np.array([0.0, np.pi])
-        lats = np.array([-np.pi / 2, np.pi / 2])
-        spherical_multipoint = SMultiPoint(lons, lats)
         shapely_multipoint = MultiPoint([(0.0, -90.0), (-180.0, 90.0)])
-        assert shapely_multipoint.equals_exact(spherical_multipoint.to_shapely(), tolerance=1e-10)
+        # compare coordinates directly instead of going through GEOS
+        assert np.allclose([np.asarray(p.coords) for p in shapely_multipoint.geoms],
+                           [np.asarray(p.coords) for p in poles_multipoint.to_shapely().geoms],
+                           atol=1e-10)
@@ -34,6 +34,7 @@ if sys.version_info < (3, 10):
 test_requires = ['rasterio', 'dask', 'xarray', 'cartopy>=0.20.0', 'pillow', 'matplotlib', 'scipy', 'zarr',
                  'pytest-lazy-fixtures', 'shapely']
 extras_require = {'numexpr': ['numexpr'],
+                  'xxhash': ['xxhash'],
                   'quicklook': ['matplotlib', 'cartopy>=0.20.0', 'pillow'],
                   'rasterio': ['rasterio'],
                   'dask': ['dask>=0.16.1'],